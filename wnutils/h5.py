@@ -19,29 +19,73 @@ class H5(wnb.Base):
     Args:
         ``file`` (:obj:`str`): The name of the hdf5 file.
 
+        ``rdcc_nbytes`` (:obj:`int`, optional): An integer giving the size
+        in bytes of the raw data chunk cache for each dataset.  For best
+        throughput, use a multiple of the dataset chunk size.  Defaults
+        to 64 MB.
+
+        ``rdcc_nslots`` (:obj:`int`, optional): An integer giving the
+        number of chunk slots in the raw data chunk cache for each
+        dataset.  Defaults to 521.
+
     """
 
-    def __init__(self, file):
-        self._h5file = h5py.File(file, "r")
+    def __init__(self, file, rdcc_nbytes=64 * 1024 * 1024, rdcc_nslots=521):
+        self._h5file = h5py.File(
+            file, "r", rdcc_nbytes=rdcc_nbytes, rdcc_nslots=rdcc_nslots
+        )
+        self._nuclide_data_array = None
+        self._nuclide_data = None
+        self._nuclide_index = None
+        self._zone_labels_cache = {}
+        self._zone_labels_hash_cache = {}
+        self._zone_property_hash_cache = {}
+        self._iterable_groups = None
+
+    def _decode_string_column(self, column):
+        if column.dtype.kind != "S":
+            column = column.astype("S")
+        return np.char.decode(column, "ascii")
+
+    def _get_group_zone_property_hash(self, group, zone_index, zone_properties=None):
+
+        if (group, zone_index) in self._zone_property_hash_cache:
+            return self._zone_property_hash_cache[(group, zone_index)]
 
-    def _get_group_zone_property_hash(self, group, zone_index):
+        if zone_properties is None:
+            zone_properties = self._h5file["/" + group + "/Zone Properties"]
 
-        properties = self._h5file["/" + group + "/Zone Properties/" + str(zone_index)]
+        properties = zone_properties[str(zone_index)][:]
+
+        fields = properties.dtype.names
+
+        names = self._decode_string_column(properties[fields[0]])
+        tags1 = self._decode_string_column(properties[fields[1]])
+        tags2 = self._decode_string_column(properties[fields[2]])
+        values = self._decode_string_column(properties[fields[3]])
+
+        tag1_used = tags1 != "0"
+        tag2_used = tags2 != "0"
 
         result = {}
 
-        for property in properties:
-            p0 = property[0].decode("ascii")
-            p1 = property[1].decode("ascii")
-            p2 = property[2].decode("ascii")
-            name = ""
-            if p1 == "0" and p2 == "0":
-                name = p0
-            elif p1 != "0" and p2 == "0":
+        for p0, p1, p2, t1, t2, value in zip(
+            names.tolist(),
+            tags1.tolist(),
+            tags2.tolist(),
+            tag1_used.tolist(),
+            tag2_used.tolist(),
+            values.tolist(),
+        ):
+            if t2:
+                name = (p0, p1, p2)
+            elif t1:
                 name = (p0, p1)
             else:
-                name = (p0, p1, p2)
-            result[name] = property[3].decode("ascii")
+                name = p0
+            result[name] = value
+
+        self._zone_property_hash_cache[(group, zone_index)] = result
 
         return result
 
@@ -57,32 +101,43 @@ class H5(wnb.Base):
 
         """
 
-        zone_labels = self._h5file["/" + group + "/Zone Labels"]
+        if group in self._zone_labels_cache:
+            return self._zone_labels_cache[group]
 
-        result = []
+        zone_labels = self._h5file["/" + group + "/Zone Labels"][:]
 
-        for i in range(len(zone_labels)):
-            result.append(
-                (
-                    zone_labels[i][0].decode("ascii"),
-                    zone_labels[i][1].decode("ascii"),
-                    zone_labels[i][2].decode("ascii"),
-                )
-            )
+        fields = zone_labels.dtype.names
+
+        labels1 = self._decode_string_column(zone_labels[fields[0]]).tolist()
+        labels2 = self._decode_string_column(zone_labels[fields[1]]).tolist()
+        labels3 = self._decode_string_column(zone_labels[fields[2]]).tolist()
+
+        result = list(zip(labels1, labels2, labels3))
+
+        self._zone_labels_cache[group] = result
 
         return result
 
     def _get_group_zone_labels_hash(self, group):
 
+        if group in self._zone_labels_hash_cache:
+            return self._zone_labels_hash_cache[group]
+
         zone_labels_array = self.get_zone_labels_for_group(group)
 
-        result = {}
+        result = dict(zip(zone_labels_array, range(len(zone_labels_array))))
 
-        for i in range(len(zone_labels_array)):
-            result[zone_labels_array[i]] = i
+        self._zone_labels_hash_cache[group] = result
 
         return result
 
+    def _resolve_zone_indices(self, zone):
+
+        return {
+            group_name: self._get_group_zone_labels_hash(group_name)[zone]
+            for group_name in self.get_iterable_groups()
+        }
+
     def get_iterable_groups(self):
         """Method to return the non-nuclide data groups in an hdf5 file.
 
@@ -91,34 +146,70 @@ class H5(wnb.Base):
 
         """
 
+        if self._iterable_groups is not None:
+            return self._iterable_groups
+
         result = []
 
         for group_name in self._h5file:
             if group_name != "Nuclide Data":
                 result.append(group_name)
 
+        self._iterable_groups = result
+
         return result
 
     def _get_nuclide_data_array(self):
 
-        result = []
+        if self._nuclide_data_array is not None:
+            return self._nuclide_data_array
+
+        nuclide_data = self._h5file["/Nuclide Data"][:]
+
+        fields = nuclide_data.dtype.names
 
-        nuclide_data = self._h5file["/Nuclide Data"]
+        names = self._decode_string_column(nuclide_data[fields[0]]).tolist()
+        zs = nuclide_data[fields[2]]
+        a_s = nuclide_data[fields[3]]
+        sources = self._decode_string_column(nuclide_data[fields[4]]).tolist()
+        states = self._decode_string_column(nuclide_data[fields[5]]).tolist()
+        mass_excesses = nuclide_data[fields[6]]
+        spins = nuclide_data[fields[7]]
+
+        result = []
 
         for i in range(len(nuclide_data)):
             data = {}
-            data["name"] = nuclide_data[i][0].decode("ascii")
-            data["z"] = nuclide_data[i][2]
-            data["a"] = nuclide_data[i][3]
+            data["name"] = names[i]
+            data["z"] = zs[i]
+            data["a"] = a_s[i]
             data["n"] = data["a"] - data["z"]
-            data["source"] = nuclide_data[i][4].decode("ascii")
-            data["state"] = nuclide_data[i][5].decode("ascii")
-            data["mass excess"] = nuclide_data[i][6]
-            data["spin"] = nuclide_data[i][7]
+            data["source"] = sources[i]
+            data["state"] = states[i]
+            data["mass excess"] = mass_excesses[i]
+            data["spin"] = spins[i]
             result.append(data)
 
+        self._nuclide_data_array = result
+
         return result
 
+    def _get_nuclide_index_hash(self):
+
+        if self._nuclide_index is None:
+            nuclide_data = self._get_nuclide_data_array()
+            self._nuclide_index = {
+                nuclide_data[i]["name"]: i for i in range(len(nuclide_data))
+            }
+
+        return self._nuclide_index
+
+    def _get_species_index_array(self, species):
+
+        index_hash = self._get_nuclide_index_hash()
+
+        return np.fromiter((index_hash[sp] for sp in species), dtype=np.intp)
+
     def get_nuclide_data(self):
         """Method to return nuclide data from an hdf5 file.
 
@@ -130,6 +221,9 @@ class H5(wnb.Base):
 
         """
 
+        if self._nuclide_data is not None:
+            return self._nuclide_data
+
         nuclide_data = self._get_nuclide_data_array()
 
         result = {}
@@ -146,6 +240,8 @@ class H5(wnb.Base):
             data["spin"] = nuclide_data[i]["spin"]
             result[nuclide_data[i]["name"]] = data
 
+        self._nuclide_data = result
+
         return result
 
     def get_group_mass_fractions(self, group):
@@ -180,20 +276,24 @@ class H5(wnb.Base):
 
         """
 
-        nuclide_hash = self.get_nuclide_data()
+        indices = self._get_species_index_array(species)
+
+        groups = self.get_iterable_groups()
+
+        zone_indices = self._resolve_zone_indices(zone)
 
         result = {}
 
         for sp in species:
-            result[sp] = np.array([])
+            result[sp] = np.empty(len(groups))
 
-        for group_name in self.get_iterable_groups():
-            zone_index = self._get_group_zone_labels_hash(group_name)
+        for i, group_name in enumerate(groups):
+            zone_index = zone_indices[group_name]
             x = self.get_group_mass_fractions(group_name)
-            for sp in species:
-                result[sp] = np.append(
-                    result[sp], x[zone_index[zone], nuclide_hash[sp]["index"]]
-                )
+            row = np.asarray(x[zone_index : zone_index + 1, :])[0]
+            values = row[indices]
+            for j, sp in enumerate(species):
+                result[sp][i] = values[j]
 
         return result
 
@@ -238,9 +338,12 @@ class H5(wnb.Base):
         for property in properties:
             result[property] = []
 
+        zone_indices = self._resolve_zone_indices(zone)
+
         for group_name in self.get_iterable_groups():
-            zone_index = self._get_group_zone_labels_hash(group_name)[zone]
-            p = self._get_group_zone_property_hash(group_name, zone_index)
+            p = self._get_group_zone_property_hash(
+                group_name, zone_indices[group_name]
+            )
             for property in properties:
                 result[property].append(p[property])
 
@@ -268,7 +371,7 @@ class H5(wnb.Base):
         props = self.get_zone_properties_in_groups(zone, properties)
 
         for prop in props:
-            result[prop] = np.array(props[prop], np.float_)
+            result[prop] = np.array(props[prop], np.float64)
 
         return result
 
@@ -293,13 +396,10 @@ class H5(wnb.Base):
         for property in properties:
             result[property] = []
 
-        zone_labels_hash = self._get_group_zone_labels_hash(group)
+        zone_properties = self._h5file["/" + group + "/Zone Properties"]
 
-        for zone_labels in self.get_zone_labels_for_group(group):
-            p = self._get_group_zone_property_hash(
-                group,
-                zone_labels_hash[(zone_labels[0], zone_labels[1], zone_labels[2])],
-            )
+        for i in range(len(self.get_zone_labels_for_group(group))):
+            p = self._get_group_zone_property_hash(group, i, zone_properties)
             for property in properties:
                 result[property].append(p[property])
 
@@ -326,7 +426,7 @@ class H5(wnb.Base):
         props = self.get_group_properties_in_zones(group, properties)
 
         for prop in props:
-            result[prop] = np.array(props[prop], np.float_)
+            result[prop] = np.array(props[prop], np.float64)
 
         return result
 
@@ -374,7 +474,9 @@ class H5(wnb.Base):
             Include directly, as a :obj:`dict`, or both.
 
         Returns:
-            A matplotlib plot.
+            The :obj:`matplotlib.figure.Figure` containing the plot, so
+            that batch callers can save or show it without going through
+            the interactive pyplot state.
 
         """
 
@@ -392,8 +494,12 @@ class H5(wnb.Base):
 
         self.apply_class_methods(plt, kwargs)
 
+        fig = plt.gcf()
+
         self.show_or_close(plt, kwargs)
 
+        return fig
+
     def plot_group_mass_fractions(
         self,
         group,
@@ -428,7 +534,9 @@ class H5(wnb.Base):
             Include directly, as a :obj:`dict`, or both.
 
         Returns:
-            A matplotlib plot.
+            The :obj:`matplotlib.figure.Figure` containing the plot, so
+            that batch callers can save or show it without going through
+            the interactive pyplot state.
 
         """
 
@@ -441,12 +549,14 @@ class H5(wnb.Base):
 
         plots = []
 
-        m = self.get_group_mass_fractions(group)
+        indices = self._get_species_index_array(species)
 
-        nuclide_data = self.get_nuclide_data()
+        m = self.get_group_mass_fractions(group)[:][:, indices]
 
         if use_latex_names:
-            latex_names = self.get_latex_names(species)
+            labels = self.get_latex_names(species)
+        else:
+            labels = {sp: sp for sp in species}
 
         for i, sp in enumerate(species):
             if plotParams is None:
@@ -454,11 +564,8 @@ class H5(wnb.Base):
             else:
                 p = plotParams[i]
             if "label" not in p:
-                if use_latex_names:
-                    p = self._merge_dicts(p, {"label": latex_names[sp]})
-                else:
-                    p = self._merge_dicts(p, {"label": sp})
-            plots.append(plt.plot(m[:, nuclide_data[sp]["index"]], **p))
+                p = self._merge_dicts(p, {"label": labels[sp]})
+            plots.append(plt.plot(m[:, i], **p))
 
         if len(species) != 1:
             plt.legend()
@@ -467,15 +574,16 @@ class H5(wnb.Base):
             if len(species) != 1:
                 plt.ylabel("Mass Fraction")
             else:
-                if use_latex_names:
-                    plt.ylabel("X(" + latex_names[species[0]] + ")")
-                else:
-                    plt.ylabel("X(" + species[0] + ")")
+                plt.ylabel("X(" + labels[species[0]] + ")")
 
         self.apply_class_methods(plt, kwargs)
 
+        fig = plt.gcf()
+
         self.show_or_close(plt, kwargs)
 
+        return fig
+
     def plot_group_property_in_zones(
         self, group, property, rcParams=None, plotParams=None, **kwargs
     ):
@@ -500,7 +608,9 @@ class H5(wnb.Base):
             Include directly, as a :obj:`dict`, or both.
 
         Returns:
-            A matplotlib plot.
+            The :obj:`matplotlib.figure.Figure` containing the plot, so
+            that batch callers can save or show it without going through
+            the interactive pyplot state.
 
         """
 
@@ -518,8 +628,12 @@ class H5(wnb.Base):
 
         self.apply_class_methods(plt, kwargs)
 
+        fig = plt.gcf()
+
         self.show_or_close(plt, kwargs)
 
+        return fig
+
     def plot_group_mass_fractions_vs_property(
         self,
         group,
@@ -563,7 +677,9 @@ class H5(wnb.Base):
             Include directly, as a :obj:`dict`, or both.
 
         Returns:
-            A matplotlib plot.
+            The :obj:`matplotlib.figure.Figure` containing the plot, so
+            that batch callers can save or show it without going through
+            the interactive pyplot state.
 
         """
 
@@ -577,24 +693,24 @@ class H5(wnb.Base):
         plots = []
 
         x = self.get_group_properties_in_zones_as_floats(group, [prop])[prop]
-        m = self.get_group_mass_fractions(group)
 
-        nuclide_data = self.get_nuclide_data()
+        indices = self._get_species_index_array(species)
+
+        m = self.get_group_mass_fractions(group)[:][:, indices]
 
         if use_latex_names:
-            latex_names = self.get_latex_names(species)
+            labels = self.get_latex_names(species)
+        else:
+            labels = {sp: sp for sp in species}
 
         for i, sp in enumerate(species):
-            y = m[:, nuclide_data[sp]["index"]]
+            y = m[:, i]
             if plotParams is None:
                 p = {}
             else:
                 p = plotParams[i]
             if "label" not in p:
-                if use_latex_names:
-                    p = self._merge_dicts(p, {"label": latex_names[sp]})
-                else:
-                    p = self._merge_dicts(p, {"label": sp})
+                p = self._merge_dicts(p, {"label": labels[sp]})
             plots.append(plt.plot(x / xfactor, y, **p))
 
         if len(species) != 1:
@@ -604,18 +720,19 @@ class H5(wnb.Base):
             if len(species) != 1:
                 plt.ylabel("Mass Fraction")
             else:
-                if use_latex_names:
-                    plt.ylabel("X(" + latex_names[species[0]] + ")")
-                else:
-                    plt.ylabel("X(" + species[0] + ")")
+                plt.ylabel("X(" + labels[species[0]] + ")")
 
         if "xlabel" not in kwargs:
             plt.xlabel(prop)
 
         self.apply_class_methods(plt, kwargs)
 
+        fig = plt.gcf()
+
         self.show_or_close(plt, kwargs)
 
+        return fig
+
     def plot_group_properties_vs_property(
         self,
         group,
@@ -660,7 +777,9 @@ class H5(wnb.Base):
             Include directly, as a :obj:`dict`, or both.
 
         Returns:
-            A matplotlib plot.
+            The :obj:`matplotlib.figure.Figure` containing the plot, so
+            that batch callers can save or show it without going through
+            the interactive pyplot state.
 
         """
 
@@ -703,8 +822,12 @@ class H5(wnb.Base):
 
         self.apply_class_methods(plt, kwargs)
 
+        fig = plt.gcf()
+
         self.show_or_close(plt, kwargs)
 
+        return fig
+
     def plot_zone_mass_fractions_vs_property(
         self,
         zone,
@@ -752,7 +875,9 @@ class H5(wnb.Base):
             Include directly, as a :obj:`dict`, or both.
 
         Returns:
-            A matplotlib plot.
+            The :obj:`matplotlib.figure.Figure` containing the plot, so
+            that batch callers can save or show it without going through
+            the interactive pyplot state.
 
         """
 
@@ -769,7 +894,9 @@ class H5(wnb.Base):
             yfactor = np.full(len(species), 1.0)
 
         if use_latex_names:
-            latex_names = self.get_latex_names(species)
+            labels = self.get_latex_names(species)
+        else:
+            labels = {sp: sp for sp in species}
 
         for i, sp in enumerate(species):
             if plotParams is None:
@@ -777,10 +904,7 @@ class H5(wnb.Base):
             else:
                 p = plotParams[i]
             if "label" not in p:
-                if use_latex_names:
-                    p = self._merge_dicts(p, {"label": latex_names[sp]})
-                else:
-                    p = self._merge_dicts(p, {"label": sp})
+                p = self._merge_dicts(p, {"label": labels[sp]})
             plt.plot(x / xfactor, m[species[i]] / yfactor[i], **p)
 
         if len(species) != 1:
@@ -790,18 +914,19 @@ class H5(wnb.Base):
             if len(species) != 1:
                 plt.ylabel("Mass Fraction")
             else:
-                if use_latex_names:
-                    plt.ylabel("X(" + latex_names[species[0]] + ")")
-                else:
-                    plt.ylabel("X(" + species[0] + ")")
+                plt.ylabel("X(" + labels[species[0]] + ")")
 
         if "xlabel" not in kwargs:
             plt.xlabel(prop)
 
         self.apply_class_methods(plt, kwargs)
 
+        fig = plt.gcf()
+
         self.show_or_close(plt, kwargs)
 
+        return fig
+
     def make_mass_fractions_movie(
         self,
         species,
@@ -875,12 +1000,14 @@ class H5(wnb.Base):
 
         self.set_plot_params(mpl, rcParams)
 
-        nuclide_data = self.get_nuclide_data()
+        indices = self._get_species_index_array(species)
 
         groups = self.get_iterable_groups()
 
         if use_latex_names:
-            latex_names = self.get_latex_names(species)
+            labels = self.get_latex_names(species)
+        else:
+            labels = {sp: sp for sp in species}
 
         def updatefig(i):
             fig.clear()
@@ -891,19 +1018,14 @@ class H5(wnb.Base):
                 else:
                     p = plotParams[j]
                 if "label" not in p:
-                    if use_latex_names:
-                        p = self._merge_dicts(p, {"label": latex_names[sp]})
-                    else:
-                        p = self._merge_dicts(p, {"label": sp})
+                    p = self._merge_dicts(p, {"label": labels[sp]})
                 if property:
                     p_prop = self.get_group_properties_in_zones_as_floats(
                         groups[i], [property]
                     )
-                    plt.plot(
-                        p_prop[property] / xfactor, x[:, nuclide_data[sp]["index"]], **p
-                    )
+                    plt.plot(p_prop[property] / xfactor, x[:, indices[j]], **p)
                 else:
-                    plt.plot(x[:, nuclide_data[sp]["index"]], **p)
+                    plt.plot(x[:, indices[j]], **p)
 
             if title_func:
                 tf = title_func(i)